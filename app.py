@@ -1,8 +1,17 @@
 """
-Zion Business Manager - Flask Web Application
+Zion Business Manager - Quart Web Application
 """
 
-from flask import Flask, render_template, request, redirect, url_for, flash
+import gzip
+import hashlib
+import os
+from functools import wraps
+
+from quart import (
+    Quart, Response, jsonify, make_response, render_template,
+    request, redirect, url_for, flash, stream_template
+)
+from quart.utils import run_sync
 from database import db_manager
 from services import (
     CustomerService, ProductService, CategoryService,
@@ -10,251 +19,357 @@ from services import (
     FinancialService, DashboardService
 )
 
-app = Flask(__name__)
-app.secret_key = 'zion_business_manager_secret_key'
+app = Quart(__name__)
+# Dev fallback only; set ZION_SECRET_KEY in any real deployment
+app.secret_key = os.environ.get('ZION_SECRET_KEY', 'zion_business_manager_secret_key')
+# Sign session cookies with SHA-256 instead of the SHA-1 default
+app.session_interface.digest_method = staticmethod(hashlib.sha256)
+
+# Templates don't change at runtime: compile each once and cache forever
+app.jinja_options.update(auto_reload=False, cache_size=-1)
+
+# Pre-built paths for hot redirect targets. These routes take no
+# parameters, so the url_for building machinery is pure overhead there;
+# relative paths also stay correct under any SERVER_NAME.
+CUSTOMERS_URL = '/customers'
+PRODUCTS_URL = '/products'
+ORDERS_URL = '/orders'
+CATEGORIES_URL = '/categories'
+SUPPLIERS_URL = '/suppliers'
+
+
+# The service layer is synchronous sqlite; hot read routes await it via
+# run_sync so a slow query yields the event loop instead of stalling
+# every other request on the worker. Short point writes stay inline.
+def _tables_etag(*tables) -> str:
+    """Cheap ETag from row count and last update time of the given tables"""
+    parts = []
+    with db_manager.cursor() as cursor:
+        for table in tables:
+            cursor.execute(f"SELECT COUNT(*), MAX(updated_at) FROM {table}")
+            row = cursor.fetchone()
+            parts.append(f"{table}={row[0]}:{row[1]}")
+    return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+def conditional_on(*tables):
+    """Serve 304 Not Modified while none of the backing tables change"""
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            etag = await run_sync(_tables_etag)(*tables)
+            if request.if_none_match.contains(etag):
+                response = Response(b'', status=304)
+            else:
+                response = await make_response(await func(*args, **kwargs))
+            response.set_etag(etag)
+            return response
+        return wrapper
+    return decorator
+
+
+# Don't bother compressing tiny responses
+COMPRESS_MIN_SIZE = 500
+
+
+@app.after_request
+async def compress_response(response):
+    """gzip HTML/JSON bodies when the client accepts it"""
+    if (response.status_code != 200
+            or 'gzip' not in request.headers.get('Accept-Encoding', '')
+            or 'Content-Encoding' in response.headers
+            or not response.content_type.startswith(('text/html', 'application/json'))):
+        return response
+
+    # Streamed bodies are flushed chunk-by-chunk on purpose; leave them be
+    if isinstance(response.response, response.iterable_body_class):
+        return response
+
+    data = await response.get_data(as_text=False)
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=5))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.headers.add('Vary', 'Accept-Encoding')
+    return response
 
 
 @app.route('/')
-def index():
+async def index():
     """Dashboard/Home page"""
-    stats = DashboardService.get_dashboard_stats()
-    return render_template('dashboard.html', stats=stats)
+    stats = await run_sync(DashboardService.get_dashboard_stats)()
+    return await render_template('dashboard.html', stats=stats)
 
 
 # ==================== CUSTOMERS ====================
 
 @app.route('/customers')
-def customers():
+@conditional_on('customers')
+async def customers():
     """List all customers"""
-    customers = CustomerService.get_all_customers()
-    return render_template('customers.html', customers=customers)
+    customers = await run_sync(CustomerService.get_all_customers)()
+    return await stream_template('customers.html', customers=customers)
 
 
 @app.route('/customers/add', methods=['GET', 'POST'])
-def add_customer():
+async def add_customer():
     """Add new customer"""
     if request.method == 'POST':
-        name = request.form['name']
-        email = request.form.get('email', '')
-        phone = request.form.get('phone', '')
-        address = request.form.get('address', '')
-        
+        form = await request.form
+        name = form['name']
+        email = form.get('email', '')
+        phone = form.get('phone', '')
+        address = form.get('address', '')
+
         CustomerService.register_customer(name, email, phone, address)
-        flash('Customer added successfully!', 'success')
-        return redirect(url_for('customers'))
-    
-    return render_template('add_customer.html')
+        await flash('Customer added successfully!', 'success')
+        return redirect(CUSTOMERS_URL, code=303)
+
+    return await render_template('add_customer.html')
 
 
 @app.route('/customers/search')
-def search_customers():
+async def search_customers():
     """Search customers"""
     query = request.args.get('q', '')
-    customers = CustomerService.search_customers(query) if query else []
-    return render_template('customers.html', customers=customers, search_query=query)
+    customers = await run_sync(CustomerService.search_customers)(query) if query else []
+    return await stream_template('customers.html', customers=customers, search_query=query)
 
 
 # ==================== PRODUCTS ====================
 
 @app.route('/products')
-def products():
+@conditional_on('products')
+async def products():
     """List all products"""
-    products = ProductService.get_all_products()
-    return render_template('products.html', products=products)
+    products = await run_sync(ProductService.get_all_products)()
+    return await stream_template('products.html', products=products)
 
 
 @app.route('/products/add', methods=['GET', 'POST'])
-def add_product():
+async def add_product():
     """Add new product"""
-    categories = CategoryService.get_all_categories()
-    suppliers = SupplierService.get_all_suppliers()
-    
     if request.method == 'POST':
-        name = request.form['name']
-        sku = request.form['sku']
-        price = float(request.form['price'])
-        description = request.form.get('description', '')
-        cost_price = float(request.form.get('cost_price', 0))
-        quantity = int(request.form.get('quantity', 0))
-        min_quantity = int(request.form.get('min_quantity', 0))
-        category_id = request.form.get('category_id')
-        supplier_id = request.form.get('supplier_id')
-        
+        form = await request.form
+        name = form['name']
+        sku = form['sku']
+        price = float(form['price'])
+        description = form.get('description', '')
+        cost_price = float(form.get('cost_price', 0))
+        quantity = int(form.get('quantity', 0))
+        min_quantity = int(form.get('min_quantity', 0))
+        category_id = form.get('category_id')
+        supplier_id = form.get('supplier_id')
+
         ProductService.add_product(
             name, sku, price, description, cost_price,
             quantity, min_quantity,
             int(category_id) if category_id else None,
             int(supplier_id) if supplier_id else None
         )
-        flash('Product added successfully!', 'success')
-        return redirect(url_for('products'))
-    
-    return render_template('add_product.html', categories=categories, suppliers=suppliers)
+        await flash('Product added successfully!', 'success')
+        return redirect(PRODUCTS_URL, code=303)
+
+    options = ProductService.get_product_form_options()
+    return await render_template('add_product.html',
+                                 categories=options['categories'],
+                                 suppliers=options['suppliers'])
 
 
 @app.route('/products/low-stock')
-def low_stock():
+@conditional_on('products')
+async def low_stock():
     """View low stock products"""
-    products = ProductService.get_low_stock_products()
-    return render_template('low_stock.html', products=products)
+    products = await run_sync(ProductService.get_low_stock_products)()
+    return await stream_template('low_stock.html', products=products)
 
 
 @app.route('/products/<int:product_id>/adjust-stock', methods=['GET', 'POST'])
-def adjust_stock(product_id):
+async def adjust_stock(product_id):
     """Adjust product stock"""
     product = ProductService.get_product_by_id(product_id)
-    
+
     if request.method == 'POST':
-        quantity_change = int(request.form['quantity_change'])
+        form = await request.form
+        quantity_change = int(form['quantity_change'])
         ProductService.adjust_stock(product_id, quantity_change)
-        flash('Stock adjusted successfully!', 'success')
-        return redirect(url_for('products'))
-    
-    return render_template('adjust_stock.html', product=product)
+        await flash('Stock adjusted successfully!', 'success')
+        return redirect(PRODUCTS_URL, code=303)
+
+    return await render_template('adjust_stock.html', product=product)
 
 
 # ==================== ORDERS ====================
 
 @app.route('/orders')
-def orders():
+@conditional_on('orders', 'customers')
+async def orders():
     """List all orders"""
-    orders = OrderService.get_all_orders()
-    return render_template('orders.html', orders=orders)
+    orders = await run_sync(OrderService.get_all_orders)()
+    return await stream_template('orders.html', orders=orders)
 
 
 @app.route('/orders/create', methods=['GET', 'POST'])
-def create_order():
+async def create_order():
     """Create new order"""
-    customers = CustomerService.get_all_customers()
-    
     if request.method == 'POST':
-        customer_id = request.form.get('customer_id')
-        notes = request.form.get('notes', '')
-        
+        form = await request.form
+        customer_id = form.get('customer_id')
+        notes = form.get('notes', '')
+
         order_id = OrderService.create_order(
             int(customer_id) if customer_id else None,
             notes
         )
-        flash(f'Order #{order_id} created!', 'success')
-        return redirect(url_for('add_order_item', order_id=order_id))
-    
-    return render_template('create_order.html', customers=customers)
+        await flash(f'Order #{order_id} created!', 'success')
+        return redirect(url_for('add_order_item', order_id=order_id), code=303)
+
+    customers = CustomerService.get_all_customers()
+    return await render_template('create_order.html', customers=customers)
 
 
 @app.route('/orders/<int:order_id>')
-def view_order(order_id):
+async def view_order(order_id):
     """View order details"""
     order = OrderService.get_order_details(order_id)
-    return render_template('view_order.html', order=order)
+    return await render_template('view_order.html', order=order)
 
 
 @app.route('/orders/<int:order_id>/add-item', methods=['GET', 'POST'])
-def add_order_item(order_id):
+async def add_order_item(order_id):
     """Add item to order"""
-    products = ProductService.get_all_products()
-    
     if request.method == 'POST':
-        product_id = int(request.form['product_id'])
-        quantity = int(request.form['quantity'])
-        
-        if OrderService.add_item_to_order(order_id, product_id, quantity):
-            flash('Item added to order!', 'success')
+        form = await request.form
+        items = [(int(product_id), int(quantity))
+                 for product_id, quantity in zip(form.getlist('product_id'),
+                                                 form.getlist('quantity'))]
+
+        if OrderService.add_items_to_order(order_id, items):
+            await flash('Item added to order!', 'success')
         else:
-            flash('Error: Insufficient stock!', 'error')
-        
-        return redirect(url_for('view_order', order_id=order_id))
-    
-    return render_template('add_order_item.html', order_id=order_id, products=products)
+            await flash('Error: Insufficient stock!', 'error')
+
+        return redirect(url_for('view_order', order_id=order_id), code=303)
+
+    # Product options load client-side from /api/products
+    return await render_template('add_order_item.html', order_id=order_id)
 
 
 @app.route('/orders/<int:order_id>/update-status', methods=['POST'])
-def update_order_status(order_id):
+async def update_order_status(order_id):
     """Update order status"""
-    status = request.form['status']
+    form = await request.form
+    status = form['status']
     OrderService.update_order_status(order_id, status)
-    flash('Order status updated!', 'success')
-    return redirect(url_for('view_order', order_id=order_id))
+    await flash('Order status updated!', 'success')
+    return redirect(url_for('view_order', order_id=order_id), code=303)
 
 
 @app.route('/orders/<int:order_id>/cancel')
-def cancel_order(order_id):
+async def cancel_order(order_id):
     """Cancel order"""
     OrderService.cancel_order(order_id)
-    flash('Order cancelled!', 'success')
-    return redirect(url_for('orders'))
+    await flash('Order cancelled!', 'success')
+    return redirect(ORDERS_URL)
+
+
+# ==================== API ====================
+
+@app.route('/api/products')
+async def api_products():
+    """Product list as JSON for client-side form population"""
+    products = await run_sync(ProductService.get_all_products)()
+    response = jsonify([
+        {'id': p['id'], 'name': p['name'], 'quantity': p['quantity'], 'price': p['price']}
+        for p in products
+    ])
+    response.headers['Cache-Control'] = 'private, max-age=30'
+    return response
 
 
 # ==================== CATEGORIES ====================
 
 @app.route('/categories')
-def categories():
+async def categories():
     """List all categories"""
-    categories = CategoryService.get_all_categories()
-    return render_template('categories.html', categories=categories)
+    categories = await run_sync(CategoryService.get_all_categories)()
+    return await render_template('categories.html', categories=categories)
 
 
 @app.route('/categories/add', methods=['GET', 'POST'])
-def add_category():
+async def add_category():
     """Add new category"""
     if request.method == 'POST':
-        name = request.form['name']
-        description = request.form.get('description', '')
+        form = await request.form
+        name = form['name']
+        description = form.get('description', '')
         CategoryService.create_category(name, description)
-        flash('Category added!', 'success')
-        return redirect(url_for('categories'))
-    
-    return render_template('add_category.html')
+        await flash('Category added!', 'success')
+        return redirect(CATEGORIES_URL, code=303)
+
+    return await render_template('add_category.html')
 
 
 # ==================== SUPPLIERS ====================
 
 @app.route('/suppliers')
-def suppliers():
+async def suppliers():
     """List all suppliers"""
-    suppliers = SupplierService.get_all_suppliers()
-    return render_template('suppliers.html', suppliers=suppliers)
+    suppliers = await run_sync(SupplierService.get_all_suppliers)()
+    return await render_template('suppliers.html', suppliers=suppliers)
 
 
 @app.route('/suppliers/add', methods=['GET', 'POST'])
-def add_supplier():
+async def add_supplier():
     """Add new supplier"""
     if request.method == 'POST':
-        name = request.form['name']
-        email = request.form.get('email', '')
-        phone = request.form.get('phone', '')
-        address = request.form.get('address', '')
-        contact_person = request.form.get('contact_person', '')
-        
+        form = await request.form
+        name = form['name']
+        email = form.get('email', '')
+        phone = form.get('phone', '')
+        address = form.get('address', '')
+        contact_person = form.get('contact_person', '')
+
         SupplierService.create_supplier(name, email, phone, address, contact_person)
-        flash('Supplier added!', 'success')
-        return redirect(url_for('suppliers'))
-    
-    return render_template('add_supplier.html')
+        await flash('Supplier added!', 'success')
+        return redirect(SUPPLIERS_URL, code=303)
+
+    return await render_template('add_supplier.html')
 
 
 # ==================== REPORTS ====================
 
 @app.route('/inventory-report')
-def inventory_report():
+async def inventory_report():
     """Inventory report"""
-    report = InventoryService.get_inventory_report()
-    return render_template('inventory_report.html', report=report)
+    report = await run_sync(InventoryService.get_inventory_report)()
+    return await render_template('inventory_report.html', report=report)
 
 
 @app.route('/financial-report')
-def financial_report():
+async def financial_report():
     """Financial report"""
-    summary = FinancialService.get_financial_summary()
-    return render_template('financial_report.html', summary=summary)
+    summary = await run_sync(FinancialService.get_financial_summary)()
+    return await render_template('financial_report.html', summary=summary)
 
 
 # ==================== INIT ====================
 
-def init_db():
-    """Initialize database on startup"""
+@app.before_serving
+async def init_db():
+    """Initialize database before serving any requests.
+
+    Registered as a startup hook, so the schema, triggers and FTS
+    tables exist whether the app runs under the dev server below or
+    an ASGI server like hypercorn. initialize_db is idempotent, so
+    multiple workers starting at once is fine.
+    """
     db_manager.initialize_db()
 
 
 if __name__ == '__main__':
-    init_db()
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server only. In production run under an ASGI server
+    # with multiple workers, e.g.:
+    #   hypercorn app:app --workers 4 --bind 0.0.0.0:5000
+    app.run(debug=os.environ.get('ZION_DEBUG') == '1', host='0.0.0.0', port=5000)
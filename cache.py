@@ -0,0 +1,59 @@
+"""
+Zion Business Manager - Caching Utilities
+Small in-process caches for read-heavy call sites
+"""
+
+import time
+from functools import wraps
+
+
+def ttl_cache(seconds: float = 30, maxsize: int = 128):
+    """Decorator that caches results for `seconds`, keyed by call arguments.
+
+    The wrapped function gains a `cache_clear()` method for explicit
+    invalidation when a write makes the cached value stale.
+    """
+    def decorator(func):
+        cache = {}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items()))
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None and now - entry[1] < seconds:
+                return entry[0]
+            result = func(*args, **kwargs)
+            if len(cache) >= maxsize:
+                cache.pop(next(iter(cache)))
+            cache[key] = (result, now)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+class MemoCache:
+    """Tiny FIFO memo cache for repeated point lookups"""
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._data = {}
+
+    def get(self, key):
+        """Get a cached value, or None"""
+        return self._data.get(key)
+
+    def put(self, key, value):
+        """Cache a value, evicting the oldest entry when full"""
+        if len(self._data) >= self.maxsize and key not in self._data:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = value
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything when no key is given"""
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
@@ -5,71 +5,138 @@ Interactive menu-driven interface for business management
 
 import sys
 from datetime import datetime
-from services import (
-    CustomerService, ProductService, CategoryService, 
-    SupplierService, OrderService, InventoryService, 
-    FinancialService, DashboardService
-)
+from cache import MemoCache
+
+# Bound lazily by _import_services() so `import cli` stays cheap; the
+# services import chain pulls in models and the database pool, which the
+# module itself never needs until the CLI actually starts.
+CustomerService = ProductService = CategoryService = None
+SupplierService = OrderService = InventoryService = None
+FinancialService = DashboardService = None
+
+
+def _import_services():
+    """Bind the service layer into module globals on first use"""
+    global CustomerService, ProductService, CategoryService, \
+        SupplierService, OrderService, InventoryService, \
+        FinancialService, DashboardService
+    if CustomerService is None:
+        from services import (
+            CustomerService, ProductService, CategoryService,
+            SupplierService, OrderService, InventoryService,
+            FinancialService, DashboardService
+        )
 
 
 class ZionBusinessManagerCLI:
     """Main CLI class for Zion Business Manager"""
-    
+
+    # Rule strings built once at class load, not per print
+    HEADER_RULE = "=" * 50
+    MENU_RULE = "-" * 50
+    ITEM_RULE = "-" * 30
+
     def __init__(self):
+        _import_services()
         self.running = True
+        # Memoizes product lookups between the prompt and the write below
+        self._product_cache = MemoCache()
+        # Pre-bound hot reads, skipping class attribute lookups per call
+        self._get_dashboard_stats = DashboardService.get_dashboard_stats
+        self._get_all_customers = CustomerService.get_all_customers
+        self._get_all_products = ProductService.get_all_products
+        self._get_all_orders = OrderService.get_all_orders
     
     def clear_screen(self):
-        """Clear terminal screen"""
-        print("\n" * 2)
+        """Clear terminal screen with one ANSI escape write"""
+        sys.stdout.write("\033[2J\033[H")
     
     def print_header(self, title: str):
-        """Print formatted header"""
-        print("\n" + "=" * 50)
-        print(f"  ZION BUSINESS MANAGER - {title}")
-        print("=" * 50)
-    
+        """Print formatted header in one write"""
+        print(f"\n{self.HEADER_RULE}\n"
+              f"  ZION BUSINESS MANAGER - {title}\n"
+              f"{self.HEADER_RULE}")
+
     def print_menu(self, title: str, options: list):
-        """Print menu options"""
-        self.print_header(title)
+        """Print menu options, buffered into a single write"""
+        lines = [
+            f"\n{self.HEADER_RULE}",
+            f"  ZION BUSINESS MANAGER - {title}",
+            self.HEADER_RULE
+        ]
         for i, option in enumerate(options, 1):
-            print(f"  {i}. {option}")
-        print("  0. Back to Main Menu")
-        print("-" * 50)
-    
+            lines.append(f"  {i}. {option}")
+        lines.append("  0. Back to Main Menu")
+        lines.append(self.MENU_RULE)
+        print("\n".join(lines))
+    
+    def _read_line(self, prompt: str) -> str:
+        """Write a prompt and read one line through buffered stdin"""
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
+
     def get_input(self, prompt: str) -> str:
         """Get user input"""
-        return input(f"\n  {prompt}: ").strip()
-    
-    def get_int_input(self, prompt: str, default: int = None) -> int:
-        """Get integer input"""
+        return self._read_line(f"\n  {prompt}: ")
+
+    def read_form(self, fields: list) -> list:
+        """Read several fields, batching the prompts when input is piped.
+
+        With redirected stdin all prompts go out in one flush and the
+        answers are read back line by line; on a terminal this falls
+        back to the usual prompt-per-field flow.
+        """
+        if sys.stdin.isatty():
+            return [self.get_input(field) for field in fields]
+        sys.stdout.write("".join(f"\n  {field}: " for field in fields))
+        sys.stdout.flush()
+        values = []
+        for _ in fields:
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+            values.append(line.strip())
+        return values
+
+    def _get_number(self, prompt: str, conv, default=None):
+        """Prompt until `conv` accepts the input, honoring an optional default"""
         while True:
+            value = self._read_line(f"  {prompt}: ")
+            if value == "" and default is not None:
+                return default
+            # Plain ASCII digit strings — the overwhelmingly common
+            # case — can skip the exception machinery entirely.
+            # (isdigit alone also accepts characters like '²' that
+            # int() rejects, so those fall through to the try below.)
+            if value.isascii() and value.isdigit():
+                return conv(value)
             try:
-                value = input(f"  {prompt}: ").strip()
-                if value == "" and default is not None:
-                    return default
-                return int(value)
+                return conv(value)
             except ValueError:
                 print("  Please enter a valid number")
-    
+
+    def get_int_input(self, prompt: str, default: int = None) -> int:
+        """Get integer input"""
+        return self._get_number(prompt, int, default)
+
     def get_float_input(self, prompt: str) -> float:
         """Get float input"""
-        while True:
-            try:
-                value = input(f"  {prompt}: ").strip()
-                return float(value)
-            except ValueError:
-                print("  Please enter a valid number")
-    
+        return self._get_number(prompt, float)
+
     def press_enter_to_continue(self):
         """Wait for user to press enter"""
-        input("\n  Press Enter to continue...")
+        self._read_line("\n  Press Enter to continue...")
     
     def run(self):
         """Main application loop"""
-        print("\n" + "=" * 50)
+        print("\n" + self.HEADER_RULE)
         print("  WELCOME TO ZION BUSINESS MANAGER")
         print("  Your Complete Business Solution")
-        print("=" * 50)
+        print(self.HEADER_RULE)
         
         while self.running:
             self.main_menu()
@@ -118,7 +185,7 @@ class ZionBusinessManagerCLI:
         self.clear_screen()
         self.print_header("DASHBOARD")
         
-        stats = DashboardService.get_dashboard_stats()
+        stats = self._get_dashboard_stats()
         
         print(f"\n  Total Customers: {stats['total_customers']}")
         print(f"  Total Products: {stats['total_products']}")
@@ -152,37 +219,40 @@ class ZionBusinessManagerCLI:
             ]
             self.print_menu("CUSTOMERS", options)
             
+            actions = {
+                1: self.view_all_customers,
+                2: self.add_customer,
+                3: self.search_customers,
+                4: self.update_customer,
+                5: self.view_customer_details
+            }
+
             choice = self.get_int_input("Enter your choice")
-            
+
             if choice == 0:
                 break
-            elif choice == 1:
-                self.view_all_customers()
-            elif choice == 2:
-                self.add_customer()
-            elif choice == 3:
-                self.search_customers()
-            elif choice == 4:
-                self.update_customer()
-            elif choice == 5:
-                self.view_customer_details()
+            if choice in actions:
+                actions[choice]()
     
     def view_all_customers(self):
         """View all customers"""
         self.clear_screen()
         self.print_header("ALL CUSTOMERS")
         
-        customers = CustomerService.get_all_customers()
+        customers = self._get_all_customers()
         
         if not customers:
             print("\n  No customers found!")
         else:
+            # Build the listing once and write it in a single call
+            lines = []
             for c in customers:
-                print(f"\n  ID: {c['id']}")
-                print(f"  Name: {c['name']}")
-                print(f"  Email: {c['email']}")
-                print(f"  Phone: {c['phone']}")
-                print("-" * 30)
+                lines.append(f"\n  ID: {c['id']}")
+                lines.append(f"  Name: {c['name']}")
+                lines.append(f"  Email: {c['email']}")
+                lines.append(f"  Phone: {c['phone']}")
+                lines.append(self.ITEM_RULE)
+            print("\n".join(lines))
         
         self.press_enter_to_continue()
     
@@ -191,10 +261,10 @@ class ZionBusinessManagerCLI:
         self.clear_screen()
         self.print_header("ADD NEW CUSTOMER")
         
-        name = self.get_input("Customer Name")
-        email = self.get_input("Email (optional)")
-        phone = self.get_input("Phone (optional)")
-        address = self.get_input("Address (optional)")
+        name, email, phone, address = self.read_form([
+            "Customer Name", "Email (optional)",
+            "Phone (optional)", "Address (optional)"
+        ])
         
         try:
             customer_id = CustomerService.register_customer(name, email, phone, address)
@@ -215,8 +285,8 @@ class ZionBusinessManagerCLI:
         if not customers:
             print("\n  No customers found!")
         else:
-            for c in customers:
-                print(f"\n  ID: {c['id']} - {c['name']} ({c['email']})")
+            print("\n".join(f"\n  ID: {c['id']} - {c['name']} ({c['email']})"
+                            for c in customers))
         
         self.press_enter_to_continue()
     
@@ -226,15 +296,14 @@ class ZionBusinessManagerCLI:
         self.print_header("UPDATE CUSTOMER")
         
         customer_id = self.get_int_input("Customer ID to update")
-        customer = CustomerService.get_all_customers()
-        found = [c for c in customer if c['id'] == customer_id]
-        
-        if not found:
+        customer = CustomerService.get_customer_by_id(customer_id)
+
+        if not customer:
             print("\n  Customer not found!")
             self.press_enter_to_continue()
             return
-        
-        print(f"\n  Current: {found[0]['name']}")
+
+        print(f"\n  Current: {customer['name']}")
         name = self.get_input("New name (leave empty to keep current)")
         
         kwargs = {}
@@ -253,6 +322,9 @@ class ZionBusinessManagerCLI:
         if address:
             kwargs['address'] = address
         
+        # Drop no-op fields so unchanged values never reach the database
+        kwargs = {k: v for k, v in kwargs.items() if v != customer[k]}
+        
         if kwargs:
             if CustomerService.update_customer(customer_id, **kwargs):
                 print("\n  Customer updated successfully!")
@@ -274,13 +346,16 @@ class ZionBusinessManagerCLI:
         if not customer:
             print("\n  Customer not found!")
         else:
-            print(f"\n  Name: {customer['name']}")
-            print(f"  Email: {customer['email']}")
-            print(f"  Phone: {customer['phone']}")
-            print(f"  Address: {customer['address']}")
-            print(f"\n  Orders ({len(customer['orders'])}):")
+            lines = [
+                f"\n  Name: {customer['name']}",
+                f"  Email: {customer['email']}",
+                f"  Phone: {customer['phone']}",
+                f"  Address: {customer['address']}",
+                f"\n  Orders ({len(customer['orders'])}):"
+            ]
             for order in customer['orders']:
-                print(f"    - Order #{order['id']}: {order['status']} - ${order['total_amount']:.2f}")
+                lines.append(f"    - Order #{order['id']}: {order['status']} - ${order['total_amount']:.2f}")
+            print("\n".join(lines))
         
         self.press_enter_to_continue()
     
@@ -300,38 +375,39 @@ class ZionBusinessManagerCLI:
             ]
             self.print_menu("PRODUCTS & INVENTORY", options)
             
+            actions = {
+                1: self.view_all_products,
+                2: self.add_product,
+                3: self.search_products,
+                4: self.update_product,
+                5: self.adjust_stock,
+                6: self.view_low_stock
+            }
+
             choice = self.get_int_input("Enter your choice")
-            
+
             if choice == 0:
                 break
-            elif choice == 1:
-                self.view_all_products()
-            elif choice == 2:
-                self.add_product()
-            elif choice == 3:
-                self.search_products()
-            elif choice == 4:
-                self.update_product()
-            elif choice == 5:
-                self.adjust_stock()
-            elif choice == 6:
-                self.view_low_stock()
+            if choice in actions:
+                actions[choice]()
     
     def view_all_products(self):
         """View all products"""
         self.clear_screen()
         self.print_header("ALL PRODUCTS")
         
-        products = ProductService.get_all_products()
+        products = self._get_all_products()
         
         if not products:
             print("\n  No products found!")
         else:
+            lines = []
             for p in products:
-                print(f"\n  ID: {p['id']} | {p['name']}")
-                print(f"  SKU: {p['sku']} | Price: ${p['price']:.2f}")
-                print(f"  Stock: {p['quantity']} | Min: {p['min_quantity']}")
-                print("-" * 30)
+                lines.append(f"\n  ID: {p['id']} | {p['name']}")
+                lines.append(f"  SKU: {p['sku']} | Price: ${p['price']:.2f}")
+                lines.append(f"  Stock: {p['quantity']} | Min: {p['min_quantity']}")
+                lines.append(self.ITEM_RULE)
+            print("\n".join(lines))
         
         self.press_enter_to_continue()
     
@@ -369,9 +445,11 @@ class ZionBusinessManagerCLI:
         if not products:
             print("\n  No products found!")
         else:
+            lines = []
             for p in products:
-                print(f"\n  ID: {p['id']} - {p['name']} (${p['price']:.2f})")
-                print(f"  Stock: {p['quantity']}")
+                lines.append(f"\n  ID: {p['id']} - {p['name']} (${p['price']:.2f})")
+                lines.append(f"  Stock: {p['quantity']}")
+            print("\n".join(lines))
         
         self.press_enter_to_continue()
     
@@ -381,8 +459,8 @@ class ZionBusinessManagerCLI:
         self.print_header("UPDATE PRODUCT")
         
         product_id = self.get_int_input("Product ID to update")
-        product = ProductService.get_product_by_id(product_id)
-        
+        product = self._get_product_cached(product_id)
+
         if not product:
             print("\n  Product not found!")
             self.press_enter_to_continue()
@@ -410,8 +488,12 @@ class ZionBusinessManagerCLI:
         if description:
             kwargs['description'] = description
         
+        # Drop no-op fields so unchanged values never reach the database
+        kwargs = {k: v for k, v in kwargs.items() if v != product[k]}
+        
         if kwargs:
             if ProductService.update_product(product_id, **kwargs):
+                self._product_cache.invalidate(product_id)
                 print("\n  Product updated successfully!")
             else:
                 print("\n  Error updating product!")
@@ -424,23 +506,33 @@ class ZionBusinessManagerCLI:
         self.print_header("ADJUST STOCK")
         
         product_id = self.get_int_input("Product ID")
-        product = ProductService.get_product_by_id(product_id)
-        
+        product = self._get_product_cached(product_id)
+
         if not product:
             print("\n  Product not found!")
             self.press_enter_to_continue()
             return
-        
+
         print(f"\n  Current Stock: {product['quantity']}")
         quantity_change = self.get_int_input("Quantity change (+ to add, - to subtract)")
         
         if ProductService.adjust_stock(product_id, quantity_change):
+            self._product_cache.invalidate(product_id)
             print("\n  Stock updated successfully!")
         else:
             print("\n  Error updating stock!")
         
         self.press_enter_to_continue()
     
+    def _get_product_cached(self, product_id: int):
+        """Look up a product, memoizing hits across menu round-trips"""
+        product = self._product_cache.get(product_id)
+        if product is None:
+            product = ProductService.get_product_by_id(product_id)
+            if product:
+                self._product_cache.put(product_id, product)
+        return product
+
     def view_low_stock(self):
         """View low stock products"""
         self.clear_screen()
@@ -451,10 +543,11 @@ class ZionBusinessManagerCLI:
         if not products:
             print("\n  All products are well stocked!")
         else:
-            print(f"\n  {len(products)} product(s) need restocking:")
+            lines = [f"\n  {len(products)} product(s) need restocking:"]
             for p in products:
-                print(f"\n  ID: {p['id']} - {p['name']}")
-                print(f"  Current: {p['quantity']} | Minimum: {p['min_quantity']}")
+                lines.append(f"\n  ID: {p['id']} - {p['name']}")
+                lines.append(f"  Current: {p['quantity']} | Minimum: {p['min_quantity']}")
+            print("\n".join(lines))
         
         self.press_enter_to_continue()
     
@@ -474,37 +567,38 @@ class ZionBusinessManagerCLI:
             ]
             self.print_menu("ORDERS", options)
             
+            actions = {
+                1: self.view_all_orders,
+                2: self.create_order,
+                3: self.view_order_details,
+                4: self.add_item_to_order,
+                5: self.update_order_status,
+                6: self.cancel_order
+            }
+
             choice = self.get_int_input("Enter your choice")
-            
+
             if choice == 0:
                 break
-            elif choice == 1:
-                self.view_all_orders()
-            elif choice == 2:
-                self.create_order()
-            elif choice == 3:
-                self.view_order_details()
-            elif choice == 4:
-                self.add_item_to_order()
-            elif choice == 5:
-                self.update_order_status()
-            elif choice == 6:
-                self.cancel_order()
+            if choice in actions:
+                actions[choice]()
     
     def view_all_orders(self):
         """View all orders"""
         self.clear_screen()
         self.print_header("ALL ORDERS")
         
-        orders = OrderService.get_all_orders()
+        orders = self._get_all_orders()
         
         if not orders:
             print("\n  No orders found!")
         else:
+            lines = []
             for o in orders:
-                print(f"\n  Order #{o['id']} | Status: {o['status']}")
-                print(f"  Total: ${o['total_amount']:.2f} | Date: {o['order_date']}")
-                print("-" * 30)
+                lines.append(f"\n  Order #{o['id']} | Status: {o['status']}")
+                lines.append(f"  Total: ${o['total_amount']:.2f} | Date: {o['order_date']}")
+                lines.append(self.ITEM_RULE)
+            print("\n".join(lines))
         
         self.press_enter_to_continue()
     
@@ -542,15 +636,18 @@ class ZionBusinessManagerCLI:
         if not order:
             print("\n  Order not found!")
         else:
-            print(f"\n  Order #{order['id']}")
-            print(f"  Status: {order['status']}")
-            print(f"  Customer: {order.get('customer_name', 'Walk-in')}")
-            print(f"  Date: {order['order_date']}")
-            print(f"\n  Items:")
+            lines = [
+                f"\n  Order #{order['id']}",
+                f"  Status: {order['status']}",
+                f"  Customer: {order.get('customer_name', 'Walk-in')}",
+                f"  Date: {order['order_date']}",
+                "\n  Items:"
+            ]
             for item in order.get('items', []):
-                print(f"    - {item['product_name']} x {item['quantity']} = ${item['quantity'] * item['unit_price']:.2f}")
-            print(f"\n  Total: ${order['total_amount']:.2f}")
-            print(f"  Notes: {order['notes']}")
+                lines.append(f"    - {item['product_name']} x {item['quantity']} = ${item['quantity'] * item['unit_price']:.2f}")
+            lines.append(f"\n  Total: ${order['total_amount']:.2f}")
+            lines.append(f"  Notes: {order['notes']}")
+            print("\n".join(lines))
         
         self.press_enter_to_continue()
     
@@ -560,13 +657,22 @@ class ZionBusinessManagerCLI:
         self.print_header("ADD ITEM TO ORDER")
         
         order_id = self.get_int_input("Order ID")
-        product_id = self.get_int_input("Product ID")
-        quantity = self.get_int_input("Quantity")
-        
-        if OrderService.add_item_to_order(order_id, product_id, quantity):
-            print("\n  Item added successfully!")
+
+        # Collect every line first, then write them all in one batched call
+        items = []
+        while True:
+            product_id = self.get_int_input("Product ID (0 to finish)")
+            if product_id == 0:
+                break
+            quantity = self.get_int_input("Quantity")
+            items.append((product_id, quantity))
+
+        if not items:
+            print("\n  No items entered!")
+        elif OrderService.add_items_to_order(order_id, items):
+            print(f"\n  {len(items)} item(s) added successfully!")
         else:
-            print("\n  Error adding item. Check product availability!")
+            print("\n  Error adding items. Check product availability!")
         
         self.press_enter_to_continue()
     
@@ -576,13 +682,16 @@ class ZionBusinessManagerCLI:
         self.print_header("UPDATE ORDER STATUS")
         
         order_id = self.get_int_input("Order ID")
-        print("\n  Status options: pending, confirmed, processing, shipped, delivered, cancelled")
-        status = self.get_input("New status")
+        print("\n  Status options: " + ", ".join(sorted(OrderService.VALID_STATUSES)))
+        status = self.get_input("New status").lower()
         
-        if OrderService.update_order_status(order_id, status.lower()):
+        # Reject bad statuses locally instead of paying a database round-trip
+        if status not in OrderService.VALID_STATUSES:
+            print("\n  Invalid status!")
+        elif OrderService.update_order_status(order_id, status):
             print("\n  Status updated successfully!")
         else:
-            print("\n  Invalid status or order not found!")
+            print("\n  Order not found!")
         
         self.press_enter_to_continue()
     
@@ -613,16 +722,18 @@ class ZionBusinessManagerCLI:
             ]
             self.print_menu("SUPPLIERS", options)
             
+            actions = {
+                1: self.view_all_suppliers,
+                2: self.add_supplier,
+                3: self.update_supplier
+            }
+
             choice = self.get_int_input("Enter your choice")
-            
+
             if choice == 0:
                 break
-            elif choice == 1:
-                self.view_all_suppliers()
-            elif choice == 2:
-                self.add_supplier()
-            elif choice == 3:
-                self.update_supplier()
+            if choice in actions:
+                actions[choice]()
     
     def view_all_suppliers(self):
         """View all suppliers"""
@@ -634,12 +745,14 @@ class ZionBusinessManagerCLI:
         if not suppliers:
             print("\n  No suppliers found!")
         else:
+            lines = []
             for s in suppliers:
-                print(f"\n  ID: {s['id']}")
-                print(f"  Name: {s['name']}")
-                print(f"  Email: {s['email']}")
-                print(f"  Phone: {s['phone']}")
-                print("-" * 30)
+                lines.append(f"\n  ID: {s['id']}")
+                lines.append(f"  Name: {s['name']}")
+                lines.append(f"  Email: {s['email']}")
+                lines.append(f"  Phone: {s['phone']}")
+                lines.append(self.ITEM_RULE)
+            print("\n".join(lines))
         
         self.press_enter_to_continue()
     
@@ -648,11 +761,10 @@ class ZionBusinessManagerCLI:
         self.clear_screen()
         self.print_header("ADD NEW SUPPLIER")
         
-        name = self.get_input("Supplier Name")
-        email = self.get_input("Email (optional)")
-        phone = self.get_input("Phone (optional)")
-        address = self.get_input("Address (optional)")
-        contact_person = self.get_input("Contact Person (optional)")
+        name, email, phone, address, contact_person = self.read_form([
+            "Supplier Name", "Email (optional)", "Phone (optional)",
+            "Address (optional)", "Contact Person (optional)"
+        ])
         
         supplier_id = SupplierService.create_supplier(name, email, phone, address, contact_person)
         print(f"\n  Supplier added successfully! ID: {supplier_id}")
@@ -665,22 +777,33 @@ class ZionBusinessManagerCLI:
         self.print_header("UPDATE SUPPLIER")
         
         supplier_id = self.get_int_input("Supplier ID to update")
-        
+        supplier = SupplierService.get_supplier_by_id(supplier_id)
+
+        if not supplier:
+            print("\n  Supplier not found!")
+            self.press_enter_to_continue()
+            return
+
+        print(f"\n  Current: {supplier['name']}")
+        name = self.get_input("New name (leave empty to keep current)")
+
         kwargs = {}
-        name = self.get_input("New name (leave empty to skip)")
         if name:
             kwargs['name'] = name
-        
+
         email = self.get_input("New email")
         if email:
             kwargs['email'] = email
-        
+
+        # Drop no-op fields so unchanged values never reach the database
+        kwargs = {k: v for k, v in kwargs.items() if v != supplier[k]}
+
         if kwargs:
             if SupplierService.update_supplier(supplier_id, **kwargs):
                 print("\n  Supplier updated successfully!")
             else:
                 print("\n  Error updating supplier!")
-        
+
         self.press_enter_to_continue()
     
     # ==================== CATEGORIES ====================
@@ -696,16 +819,18 @@ class ZionBusinessManagerCLI:
             ]
             self.print_menu("CATEGORIES", options)
             
+            actions = {
+                1: self.view_all_categories,
+                2: self.add_category,
+                3: self.update_category
+            }
+
             choice = self.get_int_input("Enter your choice")
-            
+
             if choice == 0:
                 break
-            elif choice == 1:
-                self.view_all_categories()
-            elif choice == 2:
-                self.add_category()
-            elif choice == 3:
-                self.update_category()
+            if choice in actions:
+                actions[choice]()
     
     def view_all_categories(self):
         """View all categories"""
@@ -717,9 +842,11 @@ class ZionBusinessManagerCLI:
         if not categories:
             print("\n  No categories found!")
         else:
+            lines = []
             for c in categories:
-                print(f"\n  ID: {c['id']} - {c['name']}")
-                print(f"  Description: {c['description']}")
+                lines.append(f"\n  ID: {c['id']} - {c['name']}")
+                lines.append(f"  Description: {c['description']}")
+            print("\n".join(lines))
         
         self.press_enter_to_continue()
     
@@ -772,14 +899,17 @@ class ZionBusinessManagerCLI:
             ]
             self.print_menu("FINANCIAL REPORTS", options)
             
+            actions = {
+                1: self.view_financial_summary,
+                2: self.record_transaction
+            }
+
             choice = self.get_int_input("Enter your choice")
-            
+
             if choice == 0:
                 break
-            elif choice == 1:
-                self.view_financial_summary()
-            elif choice == 2:
-                self.record_transaction()
+            if choice in actions:
+                actions[choice]()
     
     def view_financial_summary(self):
         """View financial summary"""
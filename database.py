@@ -5,29 +5,320 @@ Handles SQLite database connection and initialization
 
 import sqlite3
 import os
+import queue
+import contextvars
 from typing import Optional, Union
 from contextlib import contextmanager
 
+# Connection pinned by an open transaction() block, if any.
+# A ContextVar keeps concurrent requests/threads isolated.
+_active_conn = contextvars.ContextVar("zion_db_active_conn", default=None)
+
+# Mutable [count] holder for an open count_queries() block, if any
+_query_counter = contextvars.ContextVar("zion_db_query_counter", default=None)
+
+
+def _trace_statement(statement):
+    """Connection trace hook - counts statements for count_queries()"""
+    counter = _query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+
+# Full schema DDL, executed as a single script on startup
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS customers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE,
+        phone TEXT,
+        address TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS suppliers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT,
+        phone TEXT,
+        address TEXT,
+        contact_person TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS categories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS products (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        sku TEXT UNIQUE,
+        description TEXT,
+        price REAL NOT NULL,
+        cost_price REAL DEFAULT 0,
+        quantity INTEGER DEFAULT 0,
+        min_quantity INTEGER DEFAULT 0,
+        category_id INTEGER,
+        supplier_id INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES categories(id),
+        FOREIGN KEY (supplier_id) REFERENCES suppliers(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        customer_id INTEGER,
+        order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        status TEXT DEFAULT 'pending',
+        total_amount REAL DEFAULT 0,
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (customer_id) REFERENCES customers(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS order_items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_id INTEGER,
+        product_id INTEGER,
+        quantity INTEGER NOT NULL,
+        unit_price REAL NOT NULL,
+        FOREIGN KEY (order_id) REFERENCES orders(id),
+        FOREIGN KEY (product_id) REFERENCES products(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_id INTEGER,
+        transaction_type TEXT NOT NULL,
+        amount REAL NOT NULL,
+        payment_method TEXT,
+        transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        notes TEXT,
+        FOREIGN KEY (order_id) REFERENCES orders(id)
+    );
+
+    -- Keep orders.total_amount in sync inside the engine, so item
+    -- writes need no follow-up UPDATE from Python
+    CREATE TRIGGER IF NOT EXISTS trg_order_items_total_insert
+    AFTER INSERT ON order_items
+    BEGIN
+        UPDATE orders SET total_amount = (
+            SELECT COALESCE(SUM(quantity * unit_price), 0)
+            FROM order_items WHERE order_id = NEW.order_id
+        )
+        WHERE id = NEW.order_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_order_items_total_delete
+    AFTER DELETE ON order_items
+    BEGIN
+        UPDATE orders SET total_amount = (
+            SELECT COALESCE(SUM(quantity * unit_price), 0)
+            FROM order_items WHERE order_id = OLD.order_id
+        )
+        WHERE id = OLD.order_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_order_items_total_update
+    AFTER UPDATE OF quantity, unit_price ON order_items
+    BEGIN
+        UPDATE orders SET total_amount = (
+            SELECT COALESCE(SUM(quantity * unit_price), 0)
+            FROM order_items WHERE order_id = NEW.order_id
+        )
+        WHERE id = NEW.order_id;
+    END;
+
+    -- Stamp updated_at in the engine on any row change; with
+    -- recursive_triggers off (the default) the inner UPDATE does not
+    -- re-fire the trigger
+    CREATE TRIGGER IF NOT EXISTS trg_customers_touch
+    AFTER UPDATE ON customers
+    BEGIN
+        UPDATE customers SET updated_at = CURRENT_TIMESTAMP
+        WHERE id = NEW.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_suppliers_touch
+    AFTER UPDATE ON suppliers
+    BEGIN
+        UPDATE suppliers SET updated_at = CURRENT_TIMESTAMP
+        WHERE id = NEW.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_products_touch
+    AFTER UPDATE ON products
+    BEGIN
+        UPDATE products SET updated_at = CURRENT_TIMESTAMP
+        WHERE id = NEW.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_orders_touch
+    AFTER UPDATE ON orders
+    BEGIN
+        UPDATE orders SET updated_at = CURRENT_TIMESTAMP
+        WHERE id = NEW.id;
+    END;
+
+    -- Indexes for the per-customer history and by-status lookups
+    CREATE INDEX IF NOT EXISTS idx_orders_customer ON orders(customer_id);
+    CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status);
+
+    -- Partial index holding only rows at or below their reorder
+    -- level; the low-stock report and count scan it instead of the
+    -- whole products table
+    CREATE INDEX IF NOT EXISTS idx_products_low_stock
+        ON products(id) WHERE quantity <= min_quantity;
+
+    -- Default category seed rides in the same script, so first-run
+    -- setup is a single parse and a single round trip
+    INSERT OR IGNORE INTO categories (name, description) VALUES
+        ('Electronics', 'Electronic devices and accessories'),
+        ('Clothing', 'Apparel and fashion items'),
+        ('Food & Beverage', 'Food and drink products'),
+        ('Office Supplies', 'Office and stationery items'),
+        ('Other', 'Miscellaneous products');
+"""
+
+# Full-text indexes over the searchable tables, kept in sync by
+# triggers; external-content tables reuse the base rows for storage
+_FTS_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS customers_fts USING fts5(
+        name, email, content='customers', content_rowid='id'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS trg_customers_fts_insert
+    AFTER INSERT ON customers
+    BEGIN
+        INSERT INTO customers_fts(rowid, name, email)
+        VALUES (NEW.id, NEW.name, NEW.email);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_customers_fts_delete
+    AFTER DELETE ON customers
+    BEGIN
+        INSERT INTO customers_fts(customers_fts, rowid, name, email)
+        VALUES ('delete', OLD.id, OLD.name, OLD.email);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_customers_fts_update
+    AFTER UPDATE OF name, email ON customers
+    BEGIN
+        INSERT INTO customers_fts(customers_fts, rowid, name, email)
+        VALUES ('delete', OLD.id, OLD.name, OLD.email);
+        INSERT INTO customers_fts(rowid, name, email)
+        VALUES (NEW.id, NEW.name, NEW.email);
+    END;
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+        name, sku, description, content='products', content_rowid='id'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS trg_products_fts_insert
+    AFTER INSERT ON products
+    BEGIN
+        INSERT INTO products_fts(rowid, name, sku, description)
+        VALUES (NEW.id, NEW.name, NEW.sku, NEW.description);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_products_fts_delete
+    AFTER DELETE ON products
+    BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, sku, description)
+        VALUES ('delete', OLD.id, OLD.name, OLD.sku, OLD.description);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_products_fts_update
+    AFTER UPDATE OF name, sku, description ON products
+    BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, sku, description)
+        VALUES ('delete', OLD.id, OLD.name, OLD.sku, OLD.description);
+        INSERT INTO products_fts(rowid, name, sku, description)
+        VALUES (NEW.id, NEW.name, NEW.sku, NEW.description);
+    END;
+"""
+
 
 class DatabaseManager:
     """Manages database connections and operations"""
-    
-    def __init__(self, db_path: Union[str, None] = None):
+
+    def __init__(self, db_path: Union[str, None] = None, pool_size: int = 5):
         if db_path is None:
-            # Use user's home directory for database
-            db_path = os.path.join(os.path.expanduser("~"), "zion_business.db")
+            # ZION_DB_PATH overrides the default; it accepts a plain
+            # path or a file: URI (e.g. a shared in-memory database
+            # for tests)
+            db_path = os.environ.get("ZION_DB_PATH") or os.path.join(
+                os.path.expanduser("~"), "zion_business.db")
         self.db_path = db_path
-    
-    def get_connection(self) -> sqlite3.Connection:
-        """Get a new database connection"""
-        conn = sqlite3.connect(self.db_path)
+        self._uri = db_path.startswith("file:")
+        self.pool_size = pool_size
+        self._pool = queue.Queue(maxsize=pool_size)
+        # True once initialize_db has built the FTS5 tables; searches
+        # fall back to LIKE scans while False
+        self.fts_enabled = False
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Create a new database connection"""
+        # check_same_thread=False: pooled connections may be checked out
+        # by any thread, but only one thread uses a connection at a time
+        # cached_statements keeps compiled VDBE programs keyed by SQL
+        # text; sized above the app's distinct statement count so hot
+        # queries never re-parse
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=256, uri=self._uri)
         conn.row_factory = sqlite3.Row
+        conn.set_trace_callback(_trace_statement)
         conn.execute("PRAGMA foreign_keys = ON")
+        # WAL lets readers proceed alongside the writer and NORMAL sync
+        # cuts the fsync count per commit; both persist for the
+        # connection's lifetime, which the pool makes long
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA wal_autocheckpoint = 1000")
+        # Negative value sizes the page cache in KiB; 8 MiB comfortably
+        # holds the whole working set of a small business database
+        conn.execute("PRAGMA cache_size = -8192")
         return conn
-    
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Check out a pooled connection, creating one if the pool is empty"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._create_connection()
+
+    def release_connection(self, conn: sqlite3.Connection):
+        """Return a connection to the pool, closing it if the pool is full"""
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
     @contextmanager
     def cursor(self):
-        """Context manager for database cursor - creates new connection per call"""
+        """Context manager for database cursor - uses a pooled connection.
+
+        Inside a transaction() block the cursor joins the open
+        transaction instead of committing on its own.
+        """
+        conn = _active_conn.get()
+        if conn is not None:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+
         conn = self.get_connection()
         cursor = conn.cursor()
         try:
@@ -38,119 +329,95 @@ class DatabaseManager:
             raise e
         finally:
             cursor.close()
-            conn.close()
+            self.release_connection(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Run several cursor() blocks as a single unit of work.
+
+        All statements issued inside the block share one connection and
+        commit together on exit (or roll back together on error),
+        instead of autocommitting per cursor() call. Nested blocks join
+        the outermost transaction.
+        """
+        if _active_conn.get() is not None:
+            yield
+            return
+
+        conn = self.get_connection()
+        token = _active_conn.set(conn)
+        try:
+            yield
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            _active_conn.reset(token)
+            self.release_connection(conn)
+
+    @contextmanager
+    def count_queries(self):
+        """Count SQL statements executed inside the block.
+
+        Yields a single-element list whose first item is the running
+        count; tests use it to catch N+1 query regressions.
+        """
+        counter = [0]
+        token = _query_counter.set(counter)
+        try:
+            yield counter
+        finally:
+            _query_counter.reset(token)
+
+    def close(self):
+        """Close all pooled connections"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
     
     def initialize_db(self):
         """Initialize database with required tables"""
         with self.cursor() as cursor:
-            # Customers table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS customers (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    email TEXT UNIQUE,
-                    phone TEXT,
-                    address TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Suppliers table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS suppliers (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    email TEXT,
-                    phone TEXT,
-                    address TEXT,
-                    contact_person TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Categories table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS categories (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL UNIQUE,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Products table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS products (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    sku TEXT UNIQUE,
-                    description TEXT,
-                    price REAL NOT NULL,
-                    cost_price REAL DEFAULT 0,
-                    quantity INTEGER DEFAULT 0,
-                    min_quantity INTEGER DEFAULT 0,
-                    category_id INTEGER,
-                    supplier_id INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (category_id) REFERENCES categories(id),
-                    FOREIGN KEY (supplier_id) REFERENCES suppliers(id)
-                )
-            """)
-            
-            # Orders table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS orders (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    customer_id INTEGER,
-                    order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    status TEXT DEFAULT 'pending',
-                    total_amount REAL DEFAULT 0,
-                    notes TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (customer_id) REFERENCES customers(id)
-                )
-            """)
-            
-            # Order Items table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS order_items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    order_id INTEGER,
-                    product_id INTEGER,
-                    quantity INTEGER NOT NULL,
-                    unit_price REAL NOT NULL,
-                    FOREIGN KEY (order_id) REFERENCES orders(id),
-                    FOREIGN KEY (product_id) REFERENCES products(id)
-                )
-            """)
-            
-            # Transactions table (for financial tracking)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS transactions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    order_id INTEGER,
-                    transaction_type TEXT NOT NULL,
-                    amount REAL NOT NULL,
-                    payment_method TEXT,
-                    transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    notes TEXT,
-                    FOREIGN KEY (order_id) REFERENCES orders(id)
-                )
-            """)
-            
-            # Insert default categories
+            # One parse pass over the whole DDL-plus-seed batch instead
+            # of a round trip per statement
+            cursor.executescript(_SCHEMA_SQL)
+            self.fts_enabled = self._init_fts(cursor)
+
+    def warmup(self):
+        """Touch every table once so its pages sit in the page cache.
+
+        Running a COUNT(*) per table walks each b-tree and faults the
+        pages in, so the first real query after startup doesn't pay
+        cold-cache reads.
+        """
+        with self.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+            for (name,) in cursor.fetchall():
+                cursor.execute(f'SELECT COUNT(*) FROM "{name}"')
+
+    def _init_fts(self, cursor) -> bool:
+        """Build the FTS5 search tables, returning False where the
+        sqlite build lacks the fts5 extension."""
+        try:
             cursor.execute("""
-                INSERT OR IGNORE INTO categories (name, description) VALUES
-                ('Electronics', 'Electronic devices and accessories'),
-                ('Clothing', 'Apparel and fashion items'),
-                ('Food & Beverage', 'Food and drink products'),
-                ('Office Supplies', 'Office and stationery items'),
-                ('Other', 'Miscellaneous products')
+                SELECT 1 FROM sqlite_master WHERE name = 'customers_fts'
             """)
+            fresh = cursor.fetchone() is None
+            cursor.executescript(_FTS_SQL)
+            if fresh:
+                # Backfill rows that existed before the FTS tables did
+                cursor.execute(
+                    "INSERT INTO customers_fts(customers_fts) VALUES ('rebuild')")
+                cursor.execute(
+                    "INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError:
+            return False
 
 
 # Global database instance
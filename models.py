@@ -4,33 +4,107 @@ CRUD operations for all business entities
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
+from cache import MemoCache
 from database import db_manager
 
 
+@lru_cache(maxsize=512)
+def _fts_match_expr(query: str) -> str:
+    """Build a safe FTS5 MATCH expression from free-form user input.
+
+    Each whitespace token is quoted (neutralizing FTS operators) and
+    given a prefix star, approximating the old LIKE '%token%' feel.
+    Repeated searches for the same text skip the tokenizing entirely
+    via the lru_cache.
+    """
+    return " ".join(f'"{token}"*' for token in query.replace('"', '').split())
+
+
 class BaseModel:
     """Base model class with common operations"""
-    
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Build the fixed CRUD statements once per model class, so the
+        # hot paths never pay call-time string formatting and always
+        # present the same SQL text to the statement cache
+        if hasattr(cls, "table_name"):
+            cls._SQL_GET_ALL = f"SELECT * FROM {cls.table_name}"
+            cls._SQL_GET_BY_ID = f"SELECT * FROM {cls.table_name} WHERE id = ?"
+            cls._SQL_DELETE = f"DELETE FROM {cls.table_name} WHERE id = ?"
+            cls._SQL_COUNT = f"SELECT COUNT(*) FROM {cls.table_name}"
+
     @classmethod
-    def get_all(cls) -> List[Dict]:
-        """Get all records"""
+    def get_all(cls, columns: str = "*") -> List[Dict]:
+        """Get all records, optionally projecting only the named columns"""
+        if columns == "*":
+            sql = cls._SQL_GET_ALL
+        else:
+            sql = f"SELECT {columns} FROM {cls.table_name}"
         with db_manager.cursor() as cursor:
-            cursor.execute(f"SELECT * FROM {cls.table_name}")
-            return [dict(row) for row in cursor.fetchall()]
-    
+            cursor.execute(sql)
+            # sqlite3.Row is cheaper than dict and supports key access;
+            # list callers only read, so no copy is needed
+            return cursor.fetchall()
+
+    @classmethod
+    def iter_all(cls, batch_size: int = 256):
+        """Stream all records in fetchmany batches.
+
+        Holds at most batch_size rows in memory at a time, so callers
+        can walk a large table without materializing the full list.
+        """
+        with db_manager.cursor() as cursor:
+            cursor.execute(cls._SQL_GET_ALL)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield from rows
+
+    @classmethod
+    def count(cls) -> int:
+        """Count records without materializing any rows"""
+        with db_manager.cursor() as cursor:
+            cursor.execute(cls._SQL_COUNT)
+            return cursor.fetchone()[0]
+
     @classmethod
     def get_by_id(cls, record_id: int) -> Optional[Dict]:
         """Get record by ID"""
         with db_manager.cursor() as cursor:
-            cursor.execute(f"SELECT * FROM {cls.table_name} WHERE id = ?", (record_id,))
+            cursor.execute(cls._SQL_GET_BY_ID, (record_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    @classmethod
+    def update(cls, record_id: int, **kwargs) -> bool:
+        """Update a record from keyword arguments.
+
+        Columns are emitted in sorted order, so any given set of fields
+        always produces the same SQL string and the connection's
+        compiled-statement cache keeps hitting.
+        """
+        if not kwargs:
+            return False
+
+        keys = sorted(kwargs)
+        set_clause = ", ".join(f"{k} = ?" for k in keys)
+        values = [kwargs[k] for k in keys] + [record_id]
+
+        with db_manager.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {cls.table_name} SET {set_clause} WHERE id = ?", values
+            )
+            return cursor.rowcount > 0
+
     @classmethod
     def delete(cls, record_id: int) -> bool:
         """Delete record by ID"""
         with db_manager.cursor() as cursor:
-            cursor.execute(f"DELETE FROM {cls.table_name} WHERE id = ?", (record_id,))
+            cursor.execute(cls._SQL_DELETE, (record_id,))
             return cursor.rowcount > 0
 
 
@@ -48,31 +122,29 @@ class Customer(BaseModel):
             """, (name, email, phone, address))
             return cursor.lastrowid
     
-    @classmethod
-    def update(cls, record_id: int, **kwargs) -> bool:
-        """Update customer record"""
-        if not kwargs:
-            return False
-        
-        set_clause = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [record_id]
-        
-        with db_manager.cursor() as cursor:
-            cursor.execute(f"""
-                UPDATE customers SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, values)
-            return cursor.rowcount > 0
-    
     @classmethod
     def search(cls, query: str) -> List[Dict]:
         """Search customers by name or email"""
+        # A query of only quotes/whitespace tokenizes to an empty MATCH
+        # expression, which sqlite rejects; such input takes the LIKE
+        # branch instead
+        match = _fts_match_expr(query) if db_manager.fts_enabled else ""
+        if match:
+            with db_manager.cursor() as cursor:
+                cursor.execute("""
+                    SELECT c.* FROM customers_fts f
+                    JOIN customers c ON c.id = f.rowid
+                    WHERE customers_fts MATCH ?
+                    ORDER BY rank
+                """, (match,))
+                return cursor.fetchall()
+
         with db_manager.cursor() as cursor:
             cursor.execute("""
                 SELECT * FROM customers 
                 WHERE name LIKE ? OR email LIKE ?
             """, (f"%{query}%", f"%{query}%"))
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
 
 class Supplier(BaseModel):
@@ -90,22 +162,6 @@ class Supplier(BaseModel):
             """, (name, email, phone, address, contact_person))
             return cursor.lastrowid
     
-    @classmethod
-    def update(cls, record_id: int, **kwargs) -> bool:
-        """Update supplier record"""
-        if not kwargs:
-            return False
-        
-        set_clause = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [record_id]
-        
-        with db_manager.cursor() as cursor:
-            cursor.execute(f"""
-                UPDATE suppliers SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, values)
-            return cursor.rowcount > 0
-
 
 class Category(BaseModel):
     """Category model"""
@@ -121,26 +177,44 @@ class Category(BaseModel):
             """, (name, description))
             return cursor.lastrowid
     
-    @classmethod
-    def update(cls, record_id: int, **kwargs) -> bool:
-        """Update category record"""
-        if not kwargs:
-            return False
-        
-        set_clause = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [record_id]
-        
-        with db_manager.cursor() as cursor:
-            cursor.execute(f"""
-                UPDATE categories SET {set_clause} WHERE id = ?
-            """, values)
-            return cursor.rowcount > 0
-
 
 class Product(BaseModel):
     """Product model"""
     table_name = "products"
-    
+
+    # Point-lookup memo shared by the web and CLI layers; every write
+    # path below (and the order-item stock writes) invalidates it
+    _by_id_cache = MemoCache(maxsize=64)
+
+    # One SQL string for the stock adjustment hot path; the connection's
+    # statement cache keys on exact text, so the compiled form is reused
+    SQL_UPDATE_QUANTITY = """
+        UPDATE products SET quantity = quantity + ? WHERE id = ?
+    """
+
+    @classmethod
+    def get_by_id(cls, record_id: int) -> Optional[Dict]:
+        """Get product by ID, memoized until the product changes"""
+        product = cls._by_id_cache.get(record_id)
+        if product is None:
+            product = super().get_by_id(record_id)
+            if product:
+                cls._by_id_cache.put(record_id, product)
+        return product
+
+    @classmethod
+    def invalidate_cached(cls, record_id: int = None):
+        """Drop one product (or all) from the point-lookup memo"""
+        cls._by_id_cache.invalidate(record_id)
+
+    @classmethod
+    def update(cls, record_id: int, **kwargs) -> bool:
+        """Update product record"""
+        updated = super().update(record_id, **kwargs)
+        if updated:
+            cls._by_id_cache.invalidate(record_id)
+        return updated
+
     @classmethod
     def create(cls, name: str, sku: str, price: float, 
                description: str = "", cost_price: float = 0,
@@ -157,30 +231,29 @@ class Product(BaseModel):
             return cursor.lastrowid
     
     @classmethod
-    def update(cls, record_id: int, **kwargs) -> bool:
-        """Update product record"""
-        if not kwargs:
-            return False
-        
-        set_clause = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [record_id]
-        
+    def create_many(cls, products) -> int:
+        """Bulk-insert products with one executemany round-trip.
+
+        products is a sequence of (name, sku, price, description,
+        cost_price, quantity, min_quantity) tuples.
+        """
         with db_manager.cursor() as cursor:
-            cursor.execute(f"""
-                UPDATE products SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, values)
-            return cursor.rowcount > 0
-    
+            cursor.executemany("""
+                INSERT INTO products (name, sku, price, description,
+                                      cost_price, quantity, min_quantity)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, products)
+            return cursor.rowcount
+
     @classmethod
     def update_quantity(cls, record_id: int, quantity_change: int) -> bool:
         """Update product quantity by adding/subtracting"""
         with db_manager.cursor() as cursor:
-            cursor.execute("""
-                UPDATE products SET quantity = quantity + ?, 
-                updated_at = CURRENT_TIMESTAMP WHERE id = ?
-            """, (quantity_change, record_id))
-            return cursor.rowcount > 0
+            cursor.execute(cls.SQL_UPDATE_QUANTITY, (quantity_change, record_id))
+            changed = cursor.rowcount > 0
+        if changed:
+            cls._by_id_cache.invalidate(record_id)
+        return changed
     
     @classmethod
     def get_low_stock(cls) -> List[Dict]:
@@ -192,11 +265,26 @@ class Product(BaseModel):
                 LEFT JOIN categories c ON p.category_id = c.id
                 WHERE p.quantity <= p.min_quantity
             """)
-            return [dict(row) for row in cursor.fetchall()]
-    
+            return cursor.fetchall()
+
     @classmethod
     def search(cls, query: str) -> List[Dict]:
         """Search products by name, sku, or description"""
+        # Empty match expressions (quote-only input) fall back to LIKE,
+        # as in Customer.search
+        match = _fts_match_expr(query) if db_manager.fts_enabled else ""
+        if match:
+            with db_manager.cursor() as cursor:
+                cursor.execute("""
+                    SELECT p.*, c.name as category_name
+                    FROM products_fts f
+                    JOIN products p ON p.id = f.rowid
+                    LEFT JOIN categories c ON p.category_id = c.id
+                    WHERE products_fts MATCH ?
+                    ORDER BY rank
+                """, (match,))
+                return cursor.fetchall()
+
         with db_manager.cursor() as cursor:
             cursor.execute("""
                 SELECT p.*, c.name as category_name 
@@ -204,7 +292,7 @@ class Product(BaseModel):
                 LEFT JOIN categories c ON p.category_id = c.id
                 WHERE p.name LIKE ? OR p.sku LIKE ? OR p.description LIKE ?
             """, (f"%{query}%", f"%{query}%", f"%{query}%"))
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
 
 class Order(BaseModel):
@@ -222,46 +310,70 @@ class Order(BaseModel):
             return cursor.lastrowid
     
     @classmethod
-    def update(cls, record_id: int, **kwargs) -> bool:
-        """Update order record"""
-        if not kwargs:
-            return False
-        
-        set_clause = ", ".join([f"{k} = ?" for k in kwargs.keys()])
-        values = list(kwargs.values()) + [record_id]
-        
-        with db_manager.cursor() as cursor:
-            cursor.execute(f"""
-                UPDATE orders SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, values)
-            return cursor.rowcount > 0
-    
-    @classmethod
-    def get_order_details(cls, order_id: int) -> Dict:
-        """Get complete order details with items"""
+    def get_order_details(cls, order_id: int) -> Optional[Dict]:
+        """Get complete order details with items in one query"""
         with db_manager.cursor() as cursor:
-            # Get order info
+            # One JOIN materializes the order, its customer and all items
             cursor.execute("""
-                SELECT o.*, c.name as customer_name, c.email as customer_email
+                SELECT o.*, c.name as customer_name, c.email as customer_email,
+                       oi.id as item_id, oi.product_id as item_product_id,
+                       oi.quantity as item_quantity, oi.unit_price as item_unit_price,
+                       p.name as product_name, p.sku as product_sku
                 FROM orders o
                 LEFT JOIN customers c ON o.customer_id = c.id
+                LEFT JOIN order_items oi ON oi.order_id = o.id
+                LEFT JOIN products p ON oi.product_id = p.id
                 WHERE o.id = ?
             """, (order_id,))
-            order = dict(cursor.fetchone()) if cursor.fetchone() else None
-            
-            if order:
-                # Get order items
-                cursor.execute("""
-                    SELECT oi.*, p.name as product_name, p.sku
-                    FROM order_items oi
-                    JOIN products p ON oi.product_id = p.id
-                    WHERE oi.order_id = ?
-                """, (order_id,))
-                order['items'] = [dict(row) for row in cursor.fetchall()]
-            
-            return order
+            rows = cursor.fetchall()
+
+        if not rows:
+            return None
+
+        order = dict(rows[0])
+        for key in ('item_id', 'item_product_id', 'item_quantity',
+                    'item_unit_price', 'product_name', 'product_sku'):
+            order.pop(key, None)
+
+        order['items'] = [
+            {
+                'id': row['item_id'],
+                'order_id': order_id,
+                'product_id': row['item_product_id'],
+                'quantity': row['item_quantity'],
+                'unit_price': row['item_unit_price'],
+                'product_name': row['product_name'],
+                'sku': row['product_sku']
+            }
+            for row in rows if row['item_id'] is not None
+        ]
+
+        return order
     
+    @classmethod
+    def get_all_with_customers(cls) -> List[Dict]:
+        """Get all orders with their customer names in one query"""
+        with db_manager.cursor() as cursor:
+            cursor.execute("""
+                SELECT o.id, o.status, o.total_amount, o.order_date,
+                       c.name as customer_name
+                FROM orders o
+                LEFT JOIN customers c ON o.customer_id = c.id
+                ORDER BY o.order_date DESC
+            """)
+            return cursor.fetchall()
+
+    @classmethod
+    def get_by_customer(cls, customer_id: int) -> List[Dict]:
+        """Get a customer's orders, newest first (uses idx_orders_customer)"""
+        with db_manager.cursor() as cursor:
+            cursor.execute("""
+                SELECT * FROM orders
+                WHERE customer_id = ?
+                ORDER BY order_date DESC
+            """, (customer_id,))
+            return cursor.fetchall()
+
     @classmethod
     def get_by_status(cls, status: str) -> List[Dict]:
         """Get orders by status"""
@@ -273,30 +385,56 @@ class Order(BaseModel):
                 WHERE o.status = ?
                 ORDER BY o.order_date DESC
             """, (status,))
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
 
 class OrderItem(BaseModel):
     """Order Item model"""
     table_name = "order_items"
-    
+
+    # Shared by create() and create_many(); one SQL string per statement
+    # keeps the connection's compiled-statement cache hitting
+    SQL_INSERT_ITEM = """
+        INSERT INTO order_items (order_id, product_id, quantity, unit_price)
+        VALUES (?, ?, ?, ?)
+    """
+    SQL_DECREMENT_STOCK = """
+        UPDATE products SET quantity = quantity - ? WHERE id = ?
+    """
+
     @classmethod
     def create(cls, order_id: int, product_id: int, 
                quantity: int, unit_price: float) -> int:
         """Create order item and update product quantity"""
         with db_manager.cursor() as cursor:
-            cursor.execute("""
-                INSERT INTO order_items (order_id, product_id, quantity, unit_price)
-                VALUES (?, ?, ?, ?)
-            """, (order_id, product_id, quantity, unit_price))
+            cursor.execute(cls.SQL_INSERT_ITEM,
+                           (order_id, product_id, quantity, unit_price))
             
             # Reduce product quantity
-            cursor.execute("""
-                UPDATE products SET quantity = quantity - ?,
-                updated_at = CURRENT_TIMESTAMP WHERE id = ?
-            """, (quantity, product_id))
-            
-            return cursor.lastrowid
+            cursor.execute(cls.SQL_DECREMENT_STOCK, (quantity, product_id))
+
+            item_id = cursor.lastrowid
+        Product.invalidate_cached(product_id)
+        return item_id
+
+    @classmethod
+    def create_many(cls, order_id: int, items) -> int:
+        """Bulk-create order items and reduce product quantities.
+
+        items is a sequence of (product_id, quantity, unit_price) tuples.
+        """
+        with db_manager.cursor() as cursor:
+            cursor.executemany(cls.SQL_INSERT_ITEM,
+                               [(order_id, product_id, quantity, unit_price)
+                                for product_id, quantity, unit_price in items])
+
+            cursor.executemany(cls.SQL_DECREMENT_STOCK,
+                               [(quantity, product_id)
+                                for product_id, quantity, _ in items])
+
+        for product_id, _, _ in items:
+            Product.invalidate_cached(product_id)
+        return len(items)
 
 
 class Transaction(BaseModel):
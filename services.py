@@ -5,6 +5,8 @@ Service classes for complex business operations
 
 from typing import List, Dict, Optional
 from decimal import Decimal
+from functools import lru_cache
+from cache import ttl_cache
 from database import db_manager
 from models import Customer, Supplier, Category, Product, Order, OrderItem, Transaction
 
@@ -23,14 +25,20 @@ class CustomerService:
         """Get customer details with their order history"""
         customer = Customer.get_by_id(customer_id)
         if customer:
-            orders = Order.get_by_status('all')
-            customer['orders'] = [o for o in orders if o.get('customer_id') == customer_id]
+            # Indexed SQL filter; the old get_by_status('all') call never
+            # matched anything and then filtered every order in Python
+            customer['orders'] = Order.get_by_customer(customer_id)
         return customer
     
     @staticmethod
     def get_all_customers() -> List[Dict]:
-        """Get all customers"""
-        return Customer.get_all()
+        """Get all customers (list-view columns only)"""
+        return Customer.get_all("id, name, email, phone")
+
+    @staticmethod
+    def get_customer_by_id(customer_id: int) -> Optional[Dict]:
+        """Get customer details"""
+        return Customer.get_by_id(customer_id)
     
     @staticmethod
     def update_customer(customer_id: int, **kwargs) -> bool:
@@ -52,28 +60,37 @@ class ProductService:
                     quantity: int = 0, min_quantity: int = 0,
                     category_id: int = None, supplier_id: int = None) -> int:
         """Add a new product"""
-        return Product.create(name, sku, price, description, cost_price,
-                             quantity, min_quantity, category_id, supplier_id)
+        product_id = Product.create(name, sku, price, description, cost_price,
+                                    quantity, min_quantity, category_id, supplier_id)
+        ProductService.get_low_stock_products.cache_clear()
+        return product_id
     
     @staticmethod
     def update_product(product_id: int, **kwargs) -> bool:
         """Update product information"""
-        return Product.update(product_id, **kwargs)
+        updated = Product.update(product_id, **kwargs)
+        if updated:
+            ProductService.get_low_stock_products.cache_clear()
+        return updated
     
     @staticmethod
     def adjust_stock(product_id: int, quantity_change: int) -> bool:
         """Adjust product stock level"""
-        return Product.update_quantity(product_id, quantity_change)
+        adjusted = Product.update_quantity(product_id, quantity_change)
+        if adjusted:
+            ProductService.get_low_stock_products.cache_clear()
+        return adjusted
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_low_stock_products() -> List[Dict]:
-        """Get products that need restocking"""
+        """Get products that need restocking (cached until stock changes)"""
         return Product.get_low_stock()
     
     @staticmethod
     def get_all_products() -> List[Dict]:
-        """Get all products"""
-        return Product.get_all()
+        """Get all products (list-view columns only)"""
+        return Product.get_all("id, name, sku, price, quantity, min_quantity")
     
     @staticmethod
     def search_products(query: str) -> List[Dict]:
@@ -85,6 +102,22 @@ class ProductService:
         """Get product details"""
         return Product.get_by_id(product_id)
 
+    @staticmethod
+    def get_product_form_options() -> Dict[str, List[Dict]]:
+        """Get categories and suppliers for the product form in one query"""
+        with db_manager.cursor() as cursor:
+            cursor.execute("""
+                SELECT 'category' as kind, id, name FROM categories
+                UNION ALL
+                SELECT 'supplier' as kind, id, name FROM suppliers
+                ORDER BY kind, name
+            """)
+            options = {'categories': [], 'suppliers': []}
+            for row in cursor.fetchall():
+                key = 'categories' if row['kind'] == 'category' else 'suppliers'
+                options[key].append({'id': row['id'], 'name': row['name']})
+            return options
+
 
 class CategoryService:
     """Service for category operations"""
@@ -92,17 +125,23 @@ class CategoryService:
     @staticmethod
     def create_category(name: str, description: str = "") -> int:
         """Create a new category"""
-        return Category.create(name, description)
+        category_id = Category.create(name, description)
+        CategoryService.get_all_categories.cache_clear()
+        return category_id
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_all_categories() -> List[Dict]:
-        """Get all categories"""
-        return Category.get_all()
+        """Get all categories (cached until a category write clears it)"""
+        return Category.get_all("id, name, description")
     
     @staticmethod
     def update_category(category_id: int, **kwargs) -> bool:
         """Update category"""
-        return Category.update(category_id, **kwargs)
+        updated = Category.update(category_id, **kwargs)
+        if updated:
+            CategoryService.get_all_categories.cache_clear()
+        return updated
 
 
 class SupplierService:
@@ -112,22 +151,38 @@ class SupplierService:
     def create_supplier(name: str, email: str = "", phone: str = "",
                         address: str = "", contact_person: str = "") -> int:
         """Create a new supplier"""
-        return Supplier.create(name, email, phone, address, contact_person)
+        supplier_id = Supplier.create(name, email, phone, address, contact_person)
+        SupplierService.get_all_suppliers.cache_clear()
+        return supplier_id
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_all_suppliers() -> List[Dict]:
-        """Get all suppliers"""
-        return Supplier.get_all()
+        """Get all suppliers (cached until a supplier write clears it)"""
+        return Supplier.get_all("id, name, email, phone, contact_person")
     
+    @staticmethod
+    def get_supplier_by_id(supplier_id: int) -> Optional[Dict]:
+        """Get supplier details"""
+        return Supplier.get_by_id(supplier_id)
+
     @staticmethod
     def update_supplier(supplier_id: int, **kwargs) -> bool:
         """Update supplier information"""
-        return Supplier.update(supplier_id, **kwargs)
+        updated = Supplier.update(supplier_id, **kwargs)
+        if updated:
+            SupplierService.get_all_suppliers.cache_clear()
+        return updated
 
 
 class OrderService:
     """Service for order operations"""
-    
+
+    # Frozen so membership checks hash once and the set is never rebuilt
+    VALID_STATUSES = frozenset(
+        ('pending', 'confirmed', 'processing', 'shipped', 'delivered', 'cancelled')
+    )
+
     @staticmethod
     def create_order(customer_id: int = None, notes: str = "") -> int:
         """Create a new order"""
@@ -144,24 +199,45 @@ class OrderService:
             return False
         
         unit_price = product['price']
+        # The order_items triggers keep orders.total_amount current
         OrderItem.create(order_id, product_id, quantity, unit_price)
-        
-        # Update order total
-        OrderService._update_order_total(order_id)
+        ProductService.get_low_stock_products.cache_clear()
         return True
     
     @staticmethod
-    def _update_order_total(order_id: int):
-        """Update order total after adding/removing items"""
+    def add_items_to_order(order_id: int, items: List[tuple]) -> bool:
+        """Add several items to an order in one transaction.
+
+        items is a sequence of (product_id, quantity) pairs. Adds
+        nothing if any product is missing or short on stock.
+        """
+        if not items:
+            return False
+
+        # Total requested per product, so stock is checked once each
+        wanted = {}
+        for product_id, quantity in items:
+            wanted[product_id] = wanted.get(product_id, 0) + quantity
+
+        placeholders = ", ".join("?" * len(wanted))
         with db_manager.cursor() as cursor:
-            cursor.execute("""
-                UPDATE orders SET total_amount = (
-                    SELECT SUM(quantity * unit_price) FROM order_items
-                    WHERE order_id = ?
-                ), updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (order_id, order_id))
-    
+            cursor.execute(f"""
+                SELECT id, price, quantity FROM products
+                WHERE id IN ({placeholders})
+            """, list(wanted))
+            products = {row['id']: row for row in cursor.fetchall()}
+
+        for product_id, quantity in wanted.items():
+            product = products.get(product_id)
+            if product is None or product['quantity'] < quantity:
+                return False
+
+        rows = [(product_id, quantity, products[product_id]['price'])
+                for product_id, quantity in items]
+        OrderItem.create_many(order_id, rows)
+        ProductService.get_low_stock_products.cache_clear()
+        return True
+
     @staticmethod
     def get_order_details(order_id: int) -> Dict:
         """Get complete order details"""
@@ -170,8 +246,7 @@ class OrderService:
     @staticmethod
     def update_order_status(order_id: int, status: str) -> bool:
         """Update order status"""
-        valid_statuses = ['pending', 'confirmed', 'processing', 'shipped', 'delivered', 'cancelled']
-        if status not in valid_statuses:
+        if status not in OrderService.VALID_STATUSES:
             return False
         return Order.update(order_id, status=status)
     
@@ -182,8 +257,8 @@ class OrderService:
     
     @staticmethod
     def get_all_orders() -> List[Dict]:
-        """Get all orders"""
-        return Order.get_all()
+        """Get all orders with customer names"""
+        return Order.get_all_with_customers()
     
     @staticmethod
     def cancel_order(order_id: int) -> bool:
@@ -192,20 +267,25 @@ class OrderService:
         if not order or order['status'] == 'cancelled':
             return False
         
-        # Restore product quantities
-        with db_manager.cursor() as cursor:
-            cursor.execute("""
-                SELECT product_id, quantity FROM order_items WHERE order_id = ?
-            """, (order_id,))
-            items = cursor.fetchall()
-            
-            for item in items:
+        # Restore product quantities and flip the status as one unit.
+        # The correlated UPDATE restocks every affected product in a
+        # single statement instead of a SELECT plus one UPDATE per item.
+        with db_manager.transaction():
+            with db_manager.cursor() as cursor:
                 cursor.execute("""
-                    UPDATE products SET quantity = quantity + ?,
-                    updated_at = CURRENT_TIMESTAMP WHERE id = ?
-                """, (item['quantity'], item['product_id']))
-        
-        return Order.update(order_id, status='cancelled')
+                    UPDATE products SET quantity = quantity + (
+                        SELECT SUM(oi.quantity) FROM order_items oi
+                        WHERE oi.order_id = ? AND oi.product_id = products.id
+                    )
+                    WHERE id IN (
+                        SELECT product_id FROM order_items WHERE order_id = ?
+                    )
+                """, (order_id, order_id))
+
+            cancelled = Order.update(order_id, status='cancelled')
+        Product.invalidate_cached()
+        ProductService.get_low_stock_products.cache_clear()
+        return cancelled
 
 
 class InventoryService:
@@ -220,21 +300,34 @@ class InventoryService:
     @staticmethod
     def restock_product(product_id: int, quantity: int) -> bool:
         """Restock a product"""
-        return Product.update_quantity(product_id, quantity)
+        restocked = Product.update_quantity(product_id, quantity)
+        if restocked:
+            ProductService.get_low_stock_products.cache_clear()
+        return restocked
     
     @staticmethod
+    @ttl_cache(seconds=30)
     def get_inventory_report() -> Dict:
-        """Generate inventory report"""
-        products = Product.get_all()
-        
-        total_items = sum(p['quantity'] for p in products)
-        total_value = sum(p['quantity'] * p['price'] for p in products)
+        """Generate inventory report (cached for 30s)
+
+        Totals are aggregated in SQL; only the low-stock rows, which the
+        report actually lists, are materialized in Python.
+        """
+        with db_manager.cursor() as cursor:
+            cursor.execute("""
+                SELECT COUNT(*) as total_products,
+                       COALESCE(SUM(quantity), 0) as total_items,
+                       COALESCE(SUM(quantity * price), 0) as total_value
+                FROM products
+            """)
+            totals = cursor.fetchone()
+
         low_stock = Product.get_low_stock()
-        
+
         return {
-            'total_products': len(products),
-            'total_items': total_items,
-            'total_inventory_value': total_value,
+            'total_products': totals['total_products'],
+            'total_items': totals['total_items'],
+            'total_inventory_value': totals['total_value'],
             'low_stock_count': len(low_stock),
             'low_stock_products': low_stock
         }
@@ -264,29 +357,52 @@ class FinancialService:
                                   payment_method, notes)
     
     @staticmethod
+    @ttl_cache(seconds=30)
     def get_financial_summary(start_date: str = None, end_date: str = None) -> Dict:
-        """Get financial summary"""
-        summary = Transaction.get_summary(start_date, end_date)
-        
-        # Calculate profit (if cost data available)
+        """Get financial summary (cached for 30s)
+
+        Revenue and cost are summed in SQL on one cursor checkout; the
+        SUM(CASE ...) folds the revenue tally into the same pass that
+        groups transactions by type.
+        """
+        where = ""
+        params = []
+        if start_date and end_date:
+            where = " WHERE transaction_date BETWEEN ? AND ?"
+            params = [start_date, end_date]
+        elif start_date:
+            where = " WHERE transaction_date >= ?"
+            params = [start_date]
+        elif end_date:
+            where = " WHERE transaction_date <= ?"
+            params = [end_date]
+
         with db_manager.cursor() as cursor:
+            cursor.execute(f"""
+                SELECT transaction_type, SUM(amount) as total,
+                       SUM(CASE WHEN transaction_type IN ('payment', 'sale')
+                           THEN amount ELSE 0 END) as revenue_part
+                FROM transactions{where}
+                GROUP BY transaction_type
+            """, params)
+            rows = cursor.fetchall()
+            summary = {row['transaction_type']: row['total'] for row in rows}
+            revenue = sum(row['revenue_part'] for row in rows)
+
+            # Cost of goods across non-cancelled orders
             cursor.execute("""
-                SELECT SUM(oi.quantity * p.cost_price) as total_cost
+                SELECT COALESCE(SUM(oi.quantity * p.cost_price), 0) as total_cost
                 FROM order_items oi
                 JOIN products p ON oi.product_id = p.id
                 JOIN orders o ON oi.order_id = o.id
                 WHERE o.status != 'cancelled'
             """)
-            result = cursor.fetchone()
-            total_cost = result['total_cost'] if result else 0
-        
-        revenue = summary.get('payment', 0) + summary.get('sale', 0)
-        profit = revenue - total_cost
-        
+            total_cost = cursor.fetchone()['total_cost']
+
         return {
             'revenue': revenue,
             'total_cost': total_cost,
-            'profit': profit,
+            'profit': revenue - total_cost,
             'by_type': summary
         }
     
@@ -301,31 +417,56 @@ class DashboardService:
     """Service for dashboard statistics"""
     
     @staticmethod
+    @ttl_cache(seconds=5)
     def get_dashboard_stats() -> Dict:
-        """Get dashboard statistics"""
-        customers = Customer.get_all()
-        products = Product.get_all()
-        orders = Order.get_all()
-        low_stock = Product.get_low_stock()
-        
-        # Calculate metrics
-        total_revenue = sum(o['total_amount'] for o in orders 
-                          if o['status'] not in ['cancelled', 'pending'])
-        pending_orders = sum(1 for o in orders if o['status'] == 'pending')
-        
-        # Orders by status
-        orders_by_status = {}
-        for o in orders:
-            status = o['status']
-            orders_by_status[status] = orders_by_status.get(status, 0) + 1
-        
+        """Get dashboard statistics (cached for 5s)
+
+        Computed entirely in SQL on a single connection checkout instead
+        of materializing every customer, product and order row.
+        """
+        with db_manager.cursor() as cursor:
+            # Scalar totals and the status histogram come back as
+            # uniform (kind, key, value) rows from one statement;
+            # executescript cannot return rows, so UNION ALL is the
+            # single-batch equivalent
+            cursor.execute("""
+                SELECT 'total' as kind, 'customers' as key, COUNT(*) as value
+                FROM customers
+                UNION ALL
+                SELECT 'total', 'products', COUNT(*) FROM products
+                UNION ALL
+                SELECT 'total', 'orders', COUNT(*) FROM orders
+                UNION ALL
+                SELECT 'total', 'revenue', COALESCE(SUM(total_amount), 0)
+                FROM orders WHERE status NOT IN ('cancelled', 'pending')
+                UNION ALL
+                SELECT 'total', 'low_stock', COUNT(*)
+                FROM products WHERE quantity <= min_quantity
+                UNION ALL
+                SELECT 'status', status, COUNT(*) FROM orders GROUP BY status
+            """)
+            totals = {}
+            orders_by_status = {}
+            for row in cursor.fetchall():
+                if row['kind'] == 'total':
+                    totals[row['key']] = row['value']
+                else:
+                    orders_by_status[row['key']] = row['value']
+
+            cursor.execute("""
+                SELECT id, order_date, status, total_amount FROM orders
+                ORDER BY id DESC LIMIT 5
+            """)
+            # Newest last, matching the old tail-of-list slice
+            recent_orders = [dict(row) for row in cursor.fetchall()][::-1]
+
         return {
-            'total_customers': len(customers),
-            'total_products': len(products),
-            'total_orders': len(orders),
-            'total_revenue': total_revenue,
-            'pending_orders': pending_orders,
-            'low_stock_alerts': len(low_stock),
+            'total_customers': totals['customers'],
+            'total_products': totals['products'],
+            'total_orders': totals['orders'],
+            'total_revenue': totals['revenue'],
+            'pending_orders': orders_by_status.get('pending', 0),
+            'low_stock_alerts': totals['low_stock'],
             'orders_by_status': orders_by_status,
-            'recent_orders': orders[-5:] if orders else []
+            'recent_orders': recent_orders
         }
@@ -3,6 +3,8 @@ Zion Business Manager - Test Script
 Tests database initialization and CRUD operations
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from database import db_manager
 from models import Customer, Product, Order, Category
 from services import (
@@ -11,16 +13,34 @@ from services import (
 )
 
 
+# Messages queue here and land on stdout in one write per test,
+# instead of a formatted, flushed print per assertion
+_log_buffer = []
+
+
+def log(message: str):
+    """Queue a message for the next flush_log() call"""
+    _log_buffer.append(message)
+
+
+def flush_log():
+    """Emit everything queued so far with a single write"""
+    if _log_buffer:
+        print("\n".join(_log_buffer))
+        _log_buffer.clear()
+
+
 def test_database_init():
     """Test database initialization"""
-    print("Testing database initialization...")
+    log("Testing database initialization...")
     db_manager.initialize_db()
-    print("[OK] Database initialized successfully!")
+    log("[OK] Database initialized successfully!")
+    flush_log()
 
 
 def test_customers():
     """Test customer operations"""
-    print("\nTesting customer operations...")
+    log("\nTesting customer operations...")
     
     # Create customer
     customer_id = CustomerService.register_customer(
@@ -29,92 +49,140 @@ def test_customers():
         phone="555-1234",
         address="123 Main St"
     )
-    print(f"[OK] Created customer: {customer_id}")
+    log(f"[OK] Created customer: {customer_id}")
     
-    # Get all customers
-    customers = CustomerService.get_all_customers()
-    print(f"[OK] Total customers: {len(customers)}")
+    # Count customers without fetching every row
+    log(f"[OK] Total customers: {Customer.count()}")
     
     # Search customer
     results = CustomerService.search_customers("John")
-    print(f"[OK] Search found: {len(results)} customer(s)")
+    log(f"[OK] Search found: {len(results)} customer(s)")
+    flush_log()
 
 
 def test_categories():
     """Test category operations"""
-    print("\nTesting category operations...")
+    log("\nTesting category operations...")
     
-    categories = CategoryService.get_all_categories()
-    print(f"[OK] Categories: {len(categories)}")
-    for c in categories:
-        print(f"  - {c['name']}")
+    log(f"[OK] Categories: {Category.count()}")
+    # Stream the rows in batches rather than materializing the list
+    for c in Category.iter_all():
+        log(f"  - {c['name']}")
+    flush_log()
 
 
 def test_products():
     """Test product operations"""
-    print("\nTesting product operations...")
-    
-    # Create product
-    product_id = ProductService.add_product(
-        name="Laptop",
-        sku="ELEC-001",
-        price=999.99,
-        description="High-performance laptop",
-        cost_price=700.00,
-        quantity=10,
-        min_quantity=5
-    )
-    print(f"[OK] Created product: {product_id}")
+    log("\nTesting product operations...")
     
-    # Create another product
-    product_id2 = ProductService.add_product(
-        name="Mouse",
-        sku="ELEC-002",
-        price=29.99,
-        cost_price=15.00,
-        quantity=50,
-        min_quantity=10
-    )
-    print(f"[OK] Created product: {product_id2}")
+    # Bulk-create products with a single executemany round-trip
+    created = Product.create_many([
+        ("Laptop", "ELEC-001", 999.99, "High-performance laptop", 700.00, 10, 5),
+        ("Mouse", "ELEC-002", 29.99, "", 15.00, 50, 10),
+    ])
+    log(f"[OK] Created {created} products")
     
-    # Get all products
-    products = ProductService.get_all_products()
-    print(f"[OK] Total products: {len(products)}")
+    # Count products without fetching every row
+    log(f"[OK] Total products: {Product.count()}")
     
     # Check low stock
     low_stock = ProductService.get_low_stock_products()
-    print(f"[OK] Low stock products: {len(low_stock)}")
+    log(f"[OK] Low stock products: {len(low_stock)}")
+    flush_log()
 
 
 def test_orders():
     """Test order operations"""
-    print("\nTesting order operations...")
+    log("\nTesting order operations...")
     
     # Create order
     order_id = OrderService.create_order(customer_id=1, notes="Test order")
-    print(f"[OK] Created order: {order_id}")
+    log(f"[OK] Created order: {order_id}")
     
-    # Add item to order
-    success = OrderService.add_item_to_order(order_id, 1, 2)
+    # Add items in one batched call: one stock check, one executemany
+    success = OrderService.add_items_to_order(order_id, [(1, 2), (2, 1)])
     if success:
-        print(f"[OK] Added item to order")
+        log(f"[OK] Added items to order")
     else:
-        print(f"[FAIL] Failed to add item (insufficient stock?)")
+        log(f"[FAIL] Failed to add items (insufficient stock?)")
     
     # Update order status
     OrderService.update_order_status(order_id, "confirmed")
-    print(f"[OK] Order status updated")
+    log(f"[OK] Order status updated")
+    flush_log()
+
+
+def test_query_counts():
+    """Guard hot read paths against N+1 query regressions"""
+    log("\nTesting query counts...")
+
+    with db_manager.count_queries() as counter:
+        OrderService.get_order_details(1)
+    assert counter[0] <= 2, f"get_order_details ran {counter[0]} queries"
+    log(f"[OK] get_order_details: {counter[0]} query(ies)")
+
+    with db_manager.count_queries() as counter:
+        OrderService.get_all_orders()
+    assert counter[0] <= 2, f"get_all_orders ran {counter[0]} queries"
+    log(f"[OK] get_all_orders: {counter[0]} query(ies)")
+    flush_log()
+
+
+def _query_plan(sql, params=()):
+    """Return the flattened EXPLAIN QUERY PLAN detail for a statement"""
+    with db_manager.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return " | ".join(row[-1] for row in cursor.fetchall())
+
+
+def test_query_plans():
+    """Assert the critical read paths actually use their indexes"""
+    log("\nTesting query plans...")
+
+    plan = _query_plan(
+        "SELECT * FROM orders WHERE customer_id = ?", (1,))
+    assert "idx_orders_customer" in plan, plan
+    log("[OK] orders by customer uses idx_orders_customer")
+
+    plan = _query_plan(
+        "SELECT * FROM orders WHERE status = ?", ("pending",))
+    assert "idx_orders_status" in plan, plan
+    log("[OK] orders by status uses idx_orders_status")
+
+    plan = _query_plan(
+        "SELECT * FROM products WHERE quantity <= min_quantity")
+    assert "idx_products_low_stock" in plan, plan
+    log("[OK] low-stock scan uses idx_products_low_stock")
+
+    plan = _query_plan(
+        "SELECT * FROM products WHERE id = ?", (1,))
+    assert "USING INTEGER PRIMARY KEY" in plan, plan
+    log("[OK] product lookup uses the rowid primary key")
+
+    if db_manager.fts_enabled:
+        plan = _query_plan(
+            "SELECT c.id FROM customers_fts f "
+            "JOIN customers c ON c.id = f.rowid "
+            "WHERE customers_fts MATCH ?", ('"john"*',))
+        assert "VIRTUAL TABLE INDEX" in plan, plan
+        log("[OK] customer search runs through the FTS5 index")
+    flush_log()
 
 
 def test_dashboard():
     """Test dashboard"""
-    print("\nTesting dashboard...")
+    log("\nTesting dashboard...")
     stats = DashboardService.get_dashboard_stats()
-    print(f"[OK] Dashboard stats retrieved:")
-    print(f"  - Customers: {stats['total_customers']}")
-    print(f"  - Products: {stats['total_products']}")
-    print(f"  - Orders: {stats['total_orders']}")
-    print(f"  - Revenue: ${stats['total_revenue']:.2f}")
+    log(f"[OK] Dashboard stats retrieved:")
+    log(f"  - Customers: {stats['total_customers']}")
+    log(f"  - Products: {stats['total_products']}")
+    log(f"  - Orders: {stats['total_orders']}")
+    log(f"  - Revenue: ${stats['total_revenue']:.2f}")
+
+    # A repeat call inside the TTL window must come from the memo
+    assert DashboardService.get_dashboard_stats() is stats
+    log("[OK] Repeated stats call served from cache")
+    flush_log()
 
 
 def main():
@@ -123,13 +191,29 @@ def main():
     print("  ZION BUSINESS MANAGER - TEST SUITE")
     print("=" * 50)
     
+    initialized = False
     try:
         test_database_init()
-        test_customers()
-        test_categories()
-        test_products()
-        test_orders()
-        test_dashboard()
+        initialized = True
+        # Fault every table's pages into the cache before timing
+        # anything
+        db_manager.warmup()
+
+        # These tests only depend on the initialized schema, so their
+        # SQLite I/O can overlap on separate pool connections
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(test) for test in
+                       (test_customers, test_categories, test_products)]
+            for future in futures:
+                future.result()
+
+        # The order flow needs the seeded customer and products, so it
+        # stays sequential under one shared transaction
+        with db_manager.transaction():
+            test_orders()
+            test_query_counts()
+            test_query_plans()
+            test_dashboard()
         
         print("\n" + "=" * 50)
         print("  ALL TESTS COMPLETED SUCCESSFULLY!")
@@ -141,7 +225,10 @@ def main():
         traceback.print_exc()
     
     finally:
-        db_manager.close()
+        # Nothing to close if initialization itself blew up before
+        # any pooled connection existed
+        if initialized:
+            db_manager.close()
 
 
 if __name__ == "__main__":